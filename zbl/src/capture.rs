@@ -1,5 +1,5 @@
 use std::{
-    collections::HashMap,
+    collections::{HashMap, VecDeque},
     sync::{
         mpsc::{sync_channel, Receiver, SyncSender, TryRecvError, TrySendError},
         RwLock,
@@ -76,6 +76,11 @@ pub struct Frame<'a> {
     pub ptr: D3D11_MAPPED_SUBRESOURCE,
 }
 
+/// Number of staging textures kept alive and rotated between grabs. Keeping a few of
+/// them means a grabbed frame's mapping stays valid while the next couple of frames
+/// are being copied, and avoids re-allocating GPU memory per frame.
+const STAGING_TEXTURE_POOL_SIZE: usize = 3;
+
 pub struct Capture {
     device: ID3D11Device,
     direct3d_device: IDirect3DDevice,
@@ -86,7 +91,7 @@ pub struct Capture {
     frame_pool: Direct3D11CaptureFramePool,
     frame_source: Receiver<Option<Direct3D11CaptureFrame>>,
     session: GraphicsCaptureSession,
-    staging_texture: Option<StagingTexture>,
+    staging_textures: VecDeque<StagingTexture>,
     content_size: SizeInt32,
     stopped: bool,
 }
@@ -172,7 +177,7 @@ impl Capture {
             frame_pool,
             frame_source: receiver,
             session,
-            staging_texture: None,
+            staging_textures: VecDeque::new(),
             content_size: Default::default(),
             stopped: false,
         })
@@ -197,23 +202,35 @@ impl Capture {
     /// * `Ok(Some(...))` if there is a frame and it's been successfully captured;
     /// * `Ok(None)` if no frames can be received from the application (i.e. when the window was closed).
     /// * `Err(...)` if an error has occured while capturing a frame.
+    ///
+    /// The returned frame points into a pooled staging texture; its contents stay valid
+    /// for the next `STAGING_TEXTURE_POOL_SIZE - 1` grabs before being overwritten.
     pub fn grab(&mut self) -> Result<Option<Frame>> {
-        if self.grab_next()? {
-            let texture = self.staging_texture.as_ref().unwrap();
-            let ptr = self
-                .staging_texture
-                .as_ref()
-                .unwrap()
-                .as_mapped(&self.context)?;
-            Ok(Some(Frame {
-                texture,
-                ptr: ptr.clone(),
-            }))
+        if self.grab_next(true)? {
+            Ok(Some(self.map_current()?))
         } else {
             Ok(None)
         }
     }
 
+    /// Grab current capture frame without blocking.
+    ///
+    /// Returns `Ok(None)` both when no new frame has arrived yet and when the capture
+    /// has ended; use the blocking `grab()` when that distinction matters.
+    pub fn try_grab(&mut self) -> Result<Option<Frame>> {
+        if self.grab_next(false)? {
+            Ok(Some(self.map_current()?))
+        } else {
+            Ok(None)
+        }
+    }
+
+    fn map_current(&self) -> Result<Frame> {
+        let texture = self.staging_textures.back().unwrap();
+        let ptr = texture.as_mapped(&self.context)?;
+        Ok(Frame { texture, ptr })
+    }
+
     /// Stops the capture.
     ///
     /// This `Capture` instance cannot be reused after that (i.e. calling `start()` again will
@@ -238,7 +255,7 @@ impl Capture {
         Ok(())
     }
 
-    fn grab_next(&mut self) -> Result<bool> {
+    fn grab_next(&mut self, block: bool) -> Result<bool> {
         if self.stopped {
             return Ok(false);
         }
@@ -253,6 +270,9 @@ impl Capture {
                         self.stop()?;
                         return Ok(false);
                     }
+                    if !block {
+                        return Ok(false);
+                    }
                 }
                 Ok(None) | Err(TryRecvError::Disconnected) => return Ok(false),
             }
@@ -263,22 +283,28 @@ impl Capture {
 
         if self.content_size.Width != content_size.Width
             || self.content_size.Height != content_size.Height
-            || self.staging_texture.is_none()
+            || self.staging_textures.is_empty()
         {
             let mut desc = D3D11_TEXTURE2D_DESC::default();
             unsafe { frame_texture.GetDesc(&mut desc) };
             self.recreate_frame_pool()?;
-            let new_staging_texture = StagingTexture::new(
-                &self.device,
-                self.window_box.right - self.window_box.left,
-                self.window_box.bottom - self.window_box.top,
-                desc.Format,
-            )?;
-            self.staging_texture = Some(new_staging_texture);
+            self.staging_textures.clear();
+            for _ in 0..STAGING_TEXTURE_POOL_SIZE {
+                self.staging_textures.push_back(StagingTexture::new(
+                    &self.device,
+                    self.window_box.right - self.window_box.left,
+                    self.window_box.bottom - self.window_box.top,
+                    desc.Format,
+                )?);
+            }
             self.content_size = content_size;
         }
 
-        let copy_dest = self.staging_texture.as_ref().unwrap().as_resource()?;
+        // rotate the pool: copy into the least recently handed out texture, so
+        // mappings of the previous few frames are not clobbered by this copy
+        let texture = self.staging_textures.pop_front().unwrap();
+        self.staging_textures.push_back(texture);
+        let copy_dest = self.staging_textures.back().unwrap().as_resource()?;
         let copy_src = frame_texture.cast()?;
         unsafe {
             self.context.CopySubresourceRegion(
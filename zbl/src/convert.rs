@@ -0,0 +1,115 @@
+//! Pixel conversions over raw mapped frame memory.
+//!
+//! All functions work row-by-row honoring the source row pitch (DXGI back-buffers are
+//! often padded), and write tightly packed output. They are written as simple per-pixel
+//! loops over fixed-size chunks, which the compiler is able to autovectorize.
+
+/// BT.601 luma approximation in 8-bit fixed point; `px` is one BGRA pixel.
+#[inline]
+fn luma(px: &[u8]) -> u8 {
+    ((29 * px[0] as u32 + 150 * px[1] as u32 + 77 * px[2] as u32) >> 8) as u8
+}
+
+/// Convert BGRA rows of `row_pitch` bytes into a tightly packed grayscale image.
+///
+/// `src` must hold at least `height * row_pitch` bytes, `dst` at least
+/// `height * width` bytes.
+pub fn bgra_to_gray(src: &[u8], row_pitch: usize, width: usize, height: usize, dst: &mut [u8]) {
+    assert!(src.len() >= height * row_pitch);
+    assert!(dst.len() >= height * width);
+    for y in 0..height {
+        let row = &src[y * row_pitch..y * row_pitch + width * 4];
+        let out = &mut dst[y * width..(y + 1) * width];
+        for (px, out_px) in row.chunks_exact(4).zip(out.iter_mut()) {
+            *out_px = luma(px);
+        }
+    }
+}
+
+/// Fused grayscale conversion + nearest-neighbor downscale to `dst_width` x
+/// `dst_height`, in a single pass over the source. Avoids the intermediate
+/// full-resolution grayscale image a cvtColor + resize chain would produce.
+pub fn bgra_to_gray_resized(
+    src: &[u8],
+    row_pitch: usize,
+    width: usize,
+    height: usize,
+    dst: &mut [u8],
+    dst_width: usize,
+    dst_height: usize,
+) {
+    assert!(src.len() >= height * row_pitch);
+    assert!(dst.len() >= dst_height * dst_width);
+    // source coordinates are stepped in 16.16 fixed point
+    let x_step = (width << 16) / dst_width;
+    let y_step = (height << 16) / dst_height;
+    let mut sy = 0usize;
+    for y in 0..dst_height {
+        let row = &src[(sy >> 16) * row_pitch..];
+        let out = &mut dst[y * dst_width..(y + 1) * dst_width];
+        let mut sx = 0usize;
+        for out_px in out.iter_mut() {
+            *out_px = luma(&row[(sx >> 16) * 4..(sx >> 16) * 4 + 4]);
+            sx += x_step;
+        }
+        sy += y_step;
+    }
+}
+
+/// Copy BGRA rows of `row_pitch` bytes into a tightly packed buffer, dropping the
+/// row padding. Pixel layout is unchanged.
+///
+/// `src` must hold at least `height * row_pitch` bytes, `dst` at least
+/// `height * width * 4` bytes.
+pub fn copy_packed(src: &[u8], row_pitch: usize, width: usize, height: usize, dst: &mut [u8]) {
+    assert!(src.len() >= height * row_pitch);
+    assert!(dst.len() >= height * width * 4);
+    for y in 0..height {
+        dst[y * width * 4..(y + 1) * width * 4]
+            .copy_from_slice(&src[y * row_pitch..y * row_pitch + width * 4]);
+    }
+}
+
+/// Convert BGRA rows of `row_pitch` bytes into tightly packed RGB.
+///
+/// `src` must hold at least `height * row_pitch` bytes, `dst` at least
+/// `height * width * 3` bytes.
+pub fn bgra_to_rgb(src: &[u8], row_pitch: usize, width: usize, height: usize, dst: &mut [u8]) {
+    assert!(src.len() >= height * row_pitch);
+    assert!(dst.len() >= height * width * 3);
+    for y in 0..height {
+        let row = &src[y * row_pitch..y * row_pitch + width * 4];
+        let out = &mut dst[y * width * 3..(y + 1) * width * 3];
+        for (px, out_px) in row.chunks_exact(4).zip(out.chunks_exact_mut(3)) {
+            out_px[0] = px[2];
+            out_px[1] = px[1];
+            out_px[2] = px[0];
+        }
+    }
+}
+
+/// Convert BGRA rows of `row_pitch` bytes into tightly packed RGBA (pitch padding
+/// removed, alpha preserved).
+///
+/// `src` must hold at least `height * row_pitch` bytes, `dst` at least
+/// `height * width * 4` bytes.
+pub fn bgra_to_rgba_packed(
+    src: &[u8],
+    row_pitch: usize,
+    width: usize,
+    height: usize,
+    dst: &mut [u8],
+) {
+    assert!(src.len() >= height * row_pitch);
+    assert!(dst.len() >= height * width * 4);
+    for y in 0..height {
+        let row = &src[y * row_pitch..y * row_pitch + width * 4];
+        let out = &mut dst[y * width * 4..(y + 1) * width * 4];
+        for (px, out_px) in row.chunks_exact(4).zip(out.chunks_exact_mut(4)) {
+            out_px[0] = px[2];
+            out_px[1] = px[1];
+            out_px[2] = px[0];
+            out_px[3] = px[3];
+        }
+    }
+}
@@ -1,4 +1,5 @@
 pub mod capture;
+pub mod convert;
 pub mod staging_texture;
 pub mod util;
 pub mod window;
@@ -31,7 +32,11 @@ pub fn ro_initialize_once() {
 }
 
 pub fn set_dpi_aware() {
-    unsafe {
-        SetProcessDpiAwareness(PROCESS_SYSTEM_DPI_AWARE).ok();
+    static STATE: AtomicBool = AtomicBool::new(false);
+    let state = STATE.swap(true, Ordering::SeqCst);
+    if !state {
+        unsafe {
+            SetProcessDpiAwareness(PROCESS_SYSTEM_DPI_AWARE).ok();
+        }
     }
 }
@@ -1,6 +1,14 @@
 use ::zbl::windows::Win32::Foundation::HWND;
-use pyo3::{exceptions::PyRuntimeError, prelude::*};
+use numpy::ndarray::{ArrayView3, ShapeBuilder};
+use numpy::{PyArray2, PyArray3, PyArray4};
+use pyo3::ffi;
+use pyo3::{
+    exceptions::{PyBufferError, PyRuntimeError, PyValueError},
+    prelude::*,
+};
+use pyo3::AsPyPointer;
 use std::ffi::c_void;
+use std::os::raw::c_int;
 
 #[derive(thiserror::Error, Debug)]
 pub enum Error {
@@ -28,6 +36,125 @@ pub struct Frame {
     height: u32,
     row_pitch: u32,
     ptr: *mut c_void,
+    // (height, width, 4) / byte strides for the buffer protocol; must live as long
+    // as this object since exported Py_buffers point into them
+    shape: [ffi::Py_ssize_t; 3],
+    strides: [ffi::Py_ssize_t; 3],
+}
+
+impl Frame {
+    /// Mapped frame memory as a byte slice. Only valid while the underlying staging
+    /// texture has not been overwritten by subsequent grabs.
+    unsafe fn mapped_bytes(&self) -> &[u8] {
+        std::slice::from_raw_parts(
+            self.ptr as *const u8,
+            self.height as usize * self.row_pitch as usize,
+        )
+    }
+
+    fn checked_out_slice<'a>(out: &'a PyArray3<u8>, shape: [usize; 3]) -> PyResult<&'a mut [u8]> {
+        if out.shape() != shape {
+            return Err(PyValueError::new_err(format!(
+                "expected out array of shape {:?}, got {:?}",
+                shape,
+                out.shape()
+            )));
+        }
+        unsafe { out.as_slice_mut() }
+            .map_err(|_| PyValueError::new_err("out array must be C-contiguous"))
+    }
+
+    fn checked_out_slice_2d<'a>(out: &'a PyArray2<u8>, shape: [usize; 2]) -> PyResult<&'a mut [u8]> {
+        if out.shape() != shape {
+            return Err(PyValueError::new_err(format!(
+                "expected out array of shape {:?}, got {:?}",
+                shape,
+                out.shape()
+            )));
+        }
+        unsafe { out.as_slice_mut() }
+            .map_err(|_| PyValueError::new_err("out array must be C-contiguous"))
+    }
+
+    fn new(width: u32, height: u32, row_pitch: u32, ptr: *mut c_void) -> Self {
+        Self {
+            width,
+            height,
+            row_pitch,
+            ptr,
+            shape: [height as ffi::Py_ssize_t, width as ffi::Py_ssize_t, 4],
+            strides: [row_pitch as ffi::Py_ssize_t, 4, 1],
+        }
+    }
+}
+
+static BUFFER_FORMAT: &[u8] = b"B\0";
+
+// --- minimal DLPack ABI, see https://github.com/dmlc/dlpack ---
+
+#[repr(C)]
+struct DLDevice {
+    device_type: i32,
+    device_id: i32,
+}
+
+#[repr(C)]
+struct DLDataType {
+    code: u8,
+    bits: u8,
+    lanes: u16,
+}
+
+#[repr(C)]
+struct DLTensor {
+    data: *mut c_void,
+    device: DLDevice,
+    ndim: i32,
+    dtype: DLDataType,
+    shape: *mut i64,
+    strides: *mut i64,
+    byte_offset: u64,
+}
+
+#[repr(C)]
+struct DLManagedTensor {
+    dl_tensor: DLTensor,
+    manager_ctx: *mut c_void,
+    deleter: Option<unsafe extern "C" fn(*mut DLManagedTensor)>,
+}
+
+const DLPACK_CAPSULE_NAME: &[u8] = b"dltensor\0";
+const DL_DEVICE_TYPE_CPU: i32 = 1;
+const DL_DTYPE_CODE_UINT: u8 = 1;
+
+/// Keeps the exported tensor's shape/strides (pointed into by the `DLTensor`) and the
+/// `Frame` backing the memory alive until the consumer calls the deleter.
+struct DLPackContext {
+    shape: [i64; 3],
+    strides: [i64; 3],
+    #[allow(dead_code)]
+    frame: Py<Frame>,
+}
+
+unsafe extern "C" fn dlpack_deleter(managed: *mut DLManagedTensor) {
+    let managed = Box::from_raw(managed);
+    let ctx = Box::from_raw(managed.manager_ctx as *mut DLPackContext);
+    // dropping the context releases the Frame reference, which needs the GIL
+    Python::with_gil(move |_py| drop(ctx));
+}
+
+unsafe extern "C" fn dlpack_capsule_destructor(capsule: *mut ffi::PyObject) {
+    // per the DLPack protocol, consumers rename the capsule to "used_dltensor" once
+    // they take ownership; only run the deleter if that never happened
+    let ptr = ffi::PyCapsule_GetPointer(capsule, DLPACK_CAPSULE_NAME.as_ptr() as *const _);
+    if ptr.is_null() {
+        ffi::PyErr_Clear();
+        return;
+    }
+    let managed = ptr as *mut DLManagedTensor;
+    if let Some(deleter) = (*managed).deleter {
+        deleter(managed);
+    }
 }
 
 #[pymethods]
@@ -51,6 +178,204 @@ impl Frame {
     pub fn ptr(&self) -> usize {
         self.ptr as usize
     }
+
+    /// Get this frame as a (height, width, 4) BGRA numpy array.
+    ///
+    /// This is a zero-copy view over the mapped staging texture; row padding is handled
+    /// via strides. The array holds a reference to this `Frame`, keeping it alive for as
+    /// long as the array is reachable. Contents are overwritten by subsequent grabs.
+    pub fn as_numpy<'py>(slf: &'py PyCell<Self>) -> PyResult<&'py PyArray3<u8>> {
+        let frame = slf.borrow();
+        let view = unsafe {
+            ArrayView3::from_shape_ptr(
+                (frame.height as usize, frame.width as usize, 4)
+                    .strides((frame.row_pitch as usize, 4, 1)),
+                frame.ptr as *const u8,
+            )
+        };
+        Ok(unsafe { PyArray3::borrow_from_array(&view, slf) })
+    }
+
+    /// Copy this frame into a preallocated C-contiguous (height, width, 4) uint8
+    /// array, dropping the row padding. Unlike a numpy-level copy from the strided
+    /// view, this is a straight per-row memcpy.
+    pub fn copy_packed(&self, out: &PyArray3<u8>) -> PyResult<()> {
+        let (width, height) = (self.width as usize, self.height as usize);
+        let dst = Self::checked_out_slice(out, [height, width, 4])?;
+        ::zbl::convert::copy_packed(
+            unsafe { self.mapped_bytes() },
+            self.row_pitch as usize,
+            width,
+            height,
+            dst,
+        );
+        Ok(())
+    }
+
+    /// Convert this frame to tightly packed RGB, writing into a preallocated
+    /// C-contiguous (height, width, 3) uint8 array.
+    pub fn to_rgb(&self, out: &PyArray3<u8>) -> PyResult<()> {
+        let (width, height) = (self.width as usize, self.height as usize);
+        let dst = Self::checked_out_slice(out, [height, width, 3])?;
+        ::zbl::convert::bgra_to_rgb(
+            unsafe { self.mapped_bytes() },
+            self.row_pitch as usize,
+            width,
+            height,
+            dst,
+        );
+        Ok(())
+    }
+
+    /// Convert this frame to tightly packed RGBA (row padding removed), writing into
+    /// a preallocated C-contiguous (height, width, 4) uint8 array.
+    pub fn to_rgba_packed(&self, out: &PyArray3<u8>) -> PyResult<()> {
+        let (width, height) = (self.width as usize, self.height as usize);
+        let dst = Self::checked_out_slice(out, [height, width, 4])?;
+        ::zbl::convert::bgra_to_rgba_packed(
+            unsafe { self.mapped_bytes() },
+            self.row_pitch as usize,
+            width,
+            height,
+            dst,
+        );
+        Ok(())
+    }
+
+    /// Convert this frame to grayscale (BT.601 luma), writing into a preallocated
+    /// C-contiguous (height, width) uint8 array.
+    pub fn to_gray(&self, out: &PyArray2<u8>) -> PyResult<()> {
+        let (width, height) = (self.width as usize, self.height as usize);
+        let dst = Self::checked_out_slice_2d(out, [height, width])?;
+        ::zbl::convert::bgra_to_gray(
+            unsafe { self.mapped_bytes() },
+            self.row_pitch as usize,
+            width,
+            height,
+            dst,
+        );
+        Ok(())
+    }
+
+    /// Convert this frame to grayscale and nearest-neighbor resize it in a single
+    /// pass. The preallocated C-contiguous uint8 `out` array's shape determines the
+    /// target size.
+    pub fn to_gray_resized(&self, out: &PyArray2<u8>) -> PyResult<()> {
+        let (dst_height, dst_width) = (out.shape()[0], out.shape()[1]);
+        if dst_height == 0 || dst_width == 0 {
+            return Err(PyValueError::new_err("out array must not be empty"));
+        }
+        let dst = unsafe { out.as_slice_mut() }
+            .map_err(|_| PyValueError::new_err("out array must be C-contiguous"))?;
+        ::zbl::convert::bgra_to_gray_resized(
+            unsafe { self.mapped_bytes() },
+            self.row_pitch as usize,
+            self.width as usize,
+            self.height as usize,
+            dst,
+            dst_width,
+            dst_height,
+        );
+        Ok(())
+    }
+
+    /// Export this frame's mapped memory through the buffer protocol as a read-only
+    /// (height, width, 4) BGRA view, so `memoryview(frame)` works without building
+    /// any numpy objects. The view is overwritten by subsequent grabs.
+    unsafe fn __getbuffer__(
+        slf: &PyCell<Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("view is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("frame buffer is read-only"));
+        }
+        if (flags & ffi::PyBUF_STRIDES) != ffi::PyBUF_STRIDES {
+            return Err(PyBufferError::new_err(
+                "frame buffer is not contiguous, consumer must support strides",
+            ));
+        }
+        let frame = slf.borrow();
+        (*view).obj = slf.as_ptr();
+        ffi::Py_INCREF((*view).obj);
+        (*view).buf = frame.ptr;
+        (*view).len = frame.shape.iter().product();
+        (*view).readonly = 1;
+        (*view).itemsize = 1;
+        (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+            BUFFER_FORMAT.as_ptr() as *mut _
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).ndim = 3;
+        (*view).shape = frame.shape.as_ptr() as *mut _;
+        (*view).strides = frame.strides.as_ptr() as *mut _;
+        (*view).suboffsets = std::ptr::null_mut();
+        (*view).internal = std::ptr::null_mut();
+        Ok(())
+    }
+
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {
+        // nothing to release: the buffer aliases the staging texture mapping
+    }
+
+    /// Export this frame through the DLPack protocol, so consumers like
+    /// `torch.from_dlpack(frame)` can wrap it directly without a numpy hop.
+    ///
+    /// The frame lives in CPU-mapped staging memory by the time Python sees it, so
+    /// this is a zero-copy CPU export (device `(kDLCPU, 0)`); the capsule holds a
+    /// reference to this `Frame` to keep it alive.
+    #[args(stream = "None")]
+    pub fn __dlpack__(slf: &PyCell<Self>, stream: Option<&PyAny>) -> PyResult<PyObject> {
+        let _ = stream;
+        let py = slf.py();
+        let frame = slf.borrow();
+        let ctx = Box::new(DLPackContext {
+            shape: [frame.height as i64, frame.width as i64, 4],
+            strides: [frame.row_pitch as i64, 4, 1],
+            frame: slf.into(),
+        });
+        let shape = ctx.shape.as_ptr() as *mut i64;
+        let strides = ctx.strides.as_ptr() as *mut i64;
+        let managed = Box::new(DLManagedTensor {
+            dl_tensor: DLTensor {
+                data: frame.ptr,
+                device: DLDevice {
+                    device_type: DL_DEVICE_TYPE_CPU,
+                    device_id: 0,
+                },
+                ndim: 3,
+                dtype: DLDataType {
+                    code: DL_DTYPE_CODE_UINT,
+                    bits: 8,
+                    lanes: 1,
+                },
+                shape,
+                strides,
+                byte_offset: 0,
+            },
+            manager_ctx: Box::into_raw(ctx) as *mut c_void,
+            deleter: Some(dlpack_deleter),
+        });
+        let capsule = unsafe {
+            ffi::PyCapsule_New(
+                Box::into_raw(managed) as *mut c_void,
+                DLPACK_CAPSULE_NAME.as_ptr() as *const _,
+                Some(dlpack_capsule_destructor),
+            )
+        };
+        if capsule.is_null() {
+            return Err(PyErr::fetch(py));
+        }
+        Ok(unsafe { PyObject::from_owned_ptr(py, capsule) })
+    }
+
+    pub fn __dlpack_device__(&self) -> (i32, i32) {
+        (DL_DEVICE_TYPE_CPU, 0)
+    }
 }
 
 #[pyclass(unsendable)]
@@ -58,6 +383,34 @@ pub struct Capture {
     inner: ::zbl::Capture,
 }
 
+/// Iterator over captured frames as numpy arrays.
+///
+/// Implemented natively so that one `__next__` call does both the grab and the numpy
+/// conversion, instead of going through a Python-level generator frame per captured
+/// frame. Iteration ends when the capture does (e.g. the window is closed).
+#[pyclass(unsendable)]
+pub struct FrameIterator {
+    capture: Py<Capture>,
+}
+
+#[pymethods]
+impl FrameIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&self, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        match self.capture.as_ref(py).borrow_mut()._grab(py)? {
+            Some(frame) => {
+                let frame = Py::new(py, frame)?;
+                let array = Frame::as_numpy(frame.as_ref(py))?;
+                Ok(Some(array.to_object(py)))
+            }
+            None => Ok(None),
+        }
+    }
+}
+
 impl Capture {
     pub fn from_window(window: ::zbl::Window) -> Result<Self> {
         // TODO expose as python api, call on module loaded?
@@ -76,14 +429,43 @@ impl Capture {
         Ok(self.inner.start()?)
     }
 
-    fn _grab(&mut self) -> Result<Option<Frame>> {
-        if let Some(::zbl::Frame { texture, ptr }) = self.inner.grab()? {
-            Ok(Some(Frame {
-                width: texture.desc.Width,
-                height: texture.desc.Height,
-                row_pitch: ptr.RowPitch,
-                ptr: ptr.pData,
-            }))
+    fn _grab(&mut self, py: Python<'_>) -> Result<Option<Frame>> {
+        struct SendCapture<'a>(&'a mut ::zbl::Capture);
+        // SAFETY: allow_threads only releases the GIL, the closure still runs on the
+        // calling thread, and nothing else touches the capture while it does
+        unsafe impl Send for SendCapture<'_> {}
+        let capture = SendCapture(&mut self.inner);
+        // grab() busy-waits until a frame arrives (potentially forever, e.g. for a
+        // minimized window); release the GIL so other Python threads keep running
+        let frame = py.allow_threads(move || {
+            // the block forces the closure to capture the whole Send wrapper: with
+            // edition-2021 disjoint capture, destructuring directly would capture
+            // only the non-Send &mut field and fail allow_threads' Send bound
+            let SendCapture(capture) = { capture };
+            capture.grab().map(|frame| {
+                frame.map(|::zbl::Frame { texture, ptr }| {
+                    (
+                        texture.desc.Width,
+                        texture.desc.Height,
+                        ptr.RowPitch,
+                        ptr.pData as usize,
+                    )
+                })
+            })
+        })?;
+        Ok(frame.map(|(width, height, row_pitch, ptr)| {
+            Frame::new(width, height, row_pitch, ptr as *mut c_void)
+        }))
+    }
+
+    fn _try_grab(&mut self) -> Result<Option<Frame>> {
+        if let Some(::zbl::Frame { texture, ptr }) = self.inner.try_grab()? {
+            Ok(Some(Frame::new(
+                texture.desc.Width,
+                texture.desc.Height,
+                ptr.RowPitch,
+                ptr.pData,
+            )))
         } else {
             Ok(None)
         }
@@ -123,8 +505,70 @@ impl Capture {
         Ok(self._start()?)
     }
 
-    pub fn grab(&mut self) -> PyResult<Option<Frame>> {
-        Ok(self._grab()?)
+    pub fn grab(&mut self, py: Python<'_>) -> PyResult<Option<Frame>> {
+        Ok(self._grab(py)?)
+    }
+
+    /// Copy the next frame into a preallocated C-contiguous (height, width, 4) uint8
+    /// array without blocking. Returns True if a new frame was copied into `out`,
+    /// False if no frame is ready yet (or the capture has ended).
+    pub fn try_grab_into(&mut self, out: &PyArray3<u8>) -> PyResult<bool> {
+        if let Some(frame) = self._try_grab()? {
+            frame.copy_packed(out)?;
+            Ok(true)
+        } else {
+            Ok(false)
+        }
+    }
+
+    /// Grab up to `out.shape[0]` consecutive frames into a preallocated C-contiguous
+    /// (n, height, width, 4) uint8 array, blocking until each one arrives. Returns
+    /// the number of frames written, which is less than n only if the capture ends
+    /// mid-batch. One native call replaces n Python round-trips, which helps
+    /// recording/encoder-feeding pipelines.
+    pub fn grab_many(&mut self, py: Python<'_>, out: &PyArray4<u8>) -> PyResult<usize> {
+        let shape = out.shape().to_vec();
+        let (n, height, width) = (shape[0], shape[1], shape[2]);
+        if shape[3] != 4 {
+            return Err(PyValueError::new_err(format!(
+                "expected out array of shape (n, height, width, 4), got {:?}",
+                shape
+            )));
+        }
+        let dst = unsafe { out.as_slice_mut() }
+            .map_err(|_| PyValueError::new_err("out array must be C-contiguous"))?;
+        let frame_len = height * width * 4;
+        for i in 0..n {
+            let frame = match self._grab(py)? {
+                Some(frame) => frame,
+                None => return Ok(i),
+            };
+            if frame.height() != height || frame.width() != width {
+                return Err(PyValueError::new_err(format!(
+                    "expected frames of shape ({}, {}, 4), got ({}, {}, 4)",
+                    height,
+                    width,
+                    frame.height(),
+                    frame.width()
+                )));
+            }
+            ::zbl::convert::copy_packed(
+                unsafe { frame.mapped_bytes() },
+                frame.row_pitch(),
+                width,
+                height,
+                &mut dst[i * frame_len..(i + 1) * frame_len],
+            );
+        }
+        Ok(n)
+    }
+
+    /// Get an iterator yielding frames as numpy arrays, with grab and conversion
+    /// fused into a single native call per frame.
+    pub fn frames(slf: &PyCell<Self>) -> FrameIterator {
+        FrameIterator {
+            capture: slf.into(),
+        }
     }
 
     pub fn stop(&mut self) -> PyResult<()> {
@@ -137,5 +581,6 @@ impl Capture {
 fn zbl(_py: Python<'_>, module: &PyModule) -> PyResult<()> {
     module.add_class::<Frame>()?;
     module.add_class::<Capture>()?;
+    module.add_class::<FrameIterator>()?;
     Ok(())
 }
@@ -1,5 +1,4 @@
 import numpy
-import ctypes as C
 
 from typing import Iterator, Optional
 
@@ -7,42 +6,111 @@ from typing import Iterator, Optional
 from .zbl import Capture as _Capture, Frame
 
 
-uint8_ptr = C.POINTER(C.c_uint8)
+class _FrameBuf:
+    """Minimal provider of the numpy array interface over mapped frame memory.
+
+    Going through the buffer protocol directly is considerably cheaper per call
+    than numpy.ctypeslib / ctypes type construction.
+    """
+
+    def __init__(self, ptr: int, shape):
+        self.__array_interface__ = {
+            'data': (ptr, False),
+            'shape': shape,
+            'typestr': '|u1',
+            'version': 3,
+        }
+
+
+# bound once so the per-frame path uses LOAD_FAST/LOAD_GLOBAL on a flat name
+# instead of chained attribute lookups
+_asarray = numpy.asarray
+_as_strided = numpy.lib.stride_tricks.as_strided
 
 
 def frame_to_numpy_array(frame: Frame) -> numpy.ndarray:
-    arr = numpy.ctypeslib.as_array(
-        C.cast(frame.ptr, uint8_ptr), shape=(frame.height, frame.row_pitch))
-    if frame.row_pitch == frame.width * 4:
-        return arr.reshape(frame.height, frame.width, 4)
-    else:
-        # TODO copy to avoid slow access?
-        return arr[:, :frame.width * 4].reshape((frame.height, frame.width, 4))
+    """Wrap `frame` into a read-only, zero-copy (height, width, 4) BGRA view.
+
+    Row padding is expressed through the strides, so padded and tightly packed
+    back-buffers take the same path and nothing is ever copied here. Consumers
+    that need contiguous memory should call `numpy.ascontiguousarray` (or use
+    `frame_to_packed_array`) so that the copy is explicit. The view is read-only
+    because it aliases the mapped staging texture, whose contents are
+    overwritten by subsequent grabs.
+    """
+    ptr, height, width, row_pitch = \
+        frame.ptr, frame.height, frame.width, frame.row_pitch
+    base = _asarray(_FrameBuf(ptr, (height, row_pitch)))
+    return _as_strided(
+        base,
+        shape=(height, width, 4),
+        strides=(row_pitch, 4, 1),
+        writeable=False,
+    )
+
+
+def frame_to_packed_array(
+    frame: Frame, out: Optional[numpy.ndarray] = None
+) -> numpy.ndarray:
+    """Copy `frame` into a contiguous (height, width, 4) array, dropping row padding.
+
+    Pass a preallocated `out` to avoid allocating per frame; the packing itself is
+    a native per-row memcpy.
+    """
+    if out is None:
+        out = numpy.empty((frame.height, frame.width, 4), dtype=numpy.uint8)
+    frame.copy_packed(out)
+    return out
 
 
 class Capture:
 
     def __init__(self, name: Optional[str] = None, handle: Optional[str] = None):
         self._inner = _Capture(name, handle)
-
-    @property
-    def window(self) -> int:
-        return self._inner.window
-
-    @property
-    def process_id(self) -> int:
-        return self._inner.process_id
+        # bind native methods and per-capture constants directly instead of going
+        # through def/@property wrappers, which cost an extra Python call per use
+        self.grab = self._inner.grab
+        self.try_grab_into = self._inner.try_grab_into
+        self.grab_many = self._inner.grab_many
+        self.window: int = self._inner.window
+        self.process_id: int = self._inner.process_id
 
     def raw_frames(self) -> Iterator[Frame]:
+        grab = self._inner.grab
         while True:
-            next_frame = self._inner.grab()
+            next_frame = grab()
             if next_frame is None:
                 break
             yield next_frame
 
-    def frames(self) -> Iterator[numpy.ndarray]:
+    def frames_into(self, out: numpy.ndarray) -> Iterator[numpy.ndarray]:
+        """Like `frames()`, but copies every frame into the preallocated `out` array
+        instead of allocating per frame.
+
+        `out` must be a C-contiguous uint8 array of shape (height, width, 4) matching
+        the capture size. Every yielded array is `out` itself (same semantics as
+        OpenCV's `cap.read(dst)`), so consumers must finish with it before advancing
+        the iterator.
+        """
+        if out.dtype != numpy.uint8 or not out.flags['C_CONTIGUOUS']:
+            raise ValueError('out must be a C-contiguous uint8 array')
         for frame in self.raw_frames():
-            yield frame_to_numpy_array(frame)
+            frame.copy_packed(out)
+            yield out
+
+    def grab_memoryview(self) -> Optional[memoryview]:
+        """Grab the next frame as a read-only (height, width, 4) memoryview.
+
+        This skips ndarray construction entirely, which is useful for consumers
+        that only forward the bytes (encoders, sockets). The view aliases the
+        mapped frame memory and is overwritten by the next grab. Returns None
+        when the capture has ended.
+        """
+        frame = self._inner.grab()
+        return memoryview(frame) if frame is not None else None
+
+    def frames(self) -> Iterator[numpy.ndarray]:
+        return self._inner.frames()
 
     def __enter__(self) -> 'Capture':
         self._inner.start()
@@ -53,31 +121,63 @@ class Capture:
 
 
 def show(window_name: str):
+    import queue
+    import threading
     from time import perf_counter
+
     import cv2
 
     try:
         cv2.namedWindow('zbl', cv2.WINDOW_NORMAL)
 
-        with Capture(name=window_name) as cap:
-            t = perf_counter()
-            last_print = perf_counter()
-            t_total = 0
-            frames = 0
-            for frame in cap.frames():
-                t = perf_counter() - t
-                t_total += t
-                frames += 1
-                if perf_counter() - last_print > 1:
-                    print(f'[zbl] capture fps: {frames / t_total:.3f}')
-                    t_total = 0
-                    frames = 0
+        # the native Capture and Frame objects are unsendable (bound to the thread
+        # that created them), so the producer thread owns the entire capture and
+        # hands packed ndarray copies through a single-slot queue; only cv2 runs
+        # on the main thread. when the display falls behind, the stale frame in
+        # the slot is simply replaced. fps is counted at the producer, so it
+        # reflects the actual capture rate rather than the imshow/waitKey rate
+        slot = queue.Queue(maxsize=1)
+        done = threading.Event()
+
+        def produce():
+            try:
+                with Capture(name=window_name) as cap:
                     last_print = perf_counter()
-                cv2.imshow('zbl', frame)
-                if cv2.waitKey(8) != -1:
-                    break
-                t = perf_counter()
-
+                    frames = 0
+                    for frame in cap.raw_frames():
+                        arr = frame_to_packed_array(frame)
+                        try:
+                            slot.put_nowait(arr)
+                        except queue.Full:
+                            try:
+                                slot.get_nowait()
+                            except queue.Empty:
+                                pass
+                            slot.put_nowait(arr)
+                        t_now = perf_counter()
+                        frames += 1
+                        if t_now - last_print > 1:
+                            print(f'[zbl] capture fps: {frames / (t_now - last_print):.3f}')
+                            frames = 0
+                            last_print = t_now
+                        if done.is_set():
+                            break
+            finally:
+                done.set()
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        while not done.is_set():
+            try:
+                frame = slot.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            cv2.imshow('zbl', frame)
+            if cv2.waitKey(8) != -1:
+                done.set()
+
+        producer.join(timeout=1)
         cv2.destroyAllWindows()
     except KeyboardInterrupt:
         pass
@@ -1,4 +1,13 @@
-import sys
+import argparse
+
 import zbl
 
-zbl.show(sys.argv[1])
+# note that `python -m zbl` imports the zbl package (and with it the native
+# extension and numpy) before this module runs, so --help cannot avoid that
+# cost; only the cv2 import inside show() is deferred
+parser = argparse.ArgumentParser('zbl', description='capture a window and display it')
+parser.add_argument('window_name', help='name of the window to capture')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    zbl.show(args.window_name)